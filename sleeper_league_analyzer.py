@@ -6,131 +6,315 @@ with starter status information.
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import zstandard
 import csv
 from typing import Dict, List, Any
 import sys
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font
+import argparse
+import asyncio
+import operator
+from dataclasses import asdict
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache, cached
+from team_aggregation import process_rosters
+
+# Quasi-static endpoints are kept on disk along with their ETag/Last-Modified
+# validators, so warm runs can revalidate them instead of downloading again
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sleeper")
+CACHE_FORMAT = "json.zst"
+# The full NFL player dump is large and rarely changes, so it isn't even revalidated for a day
+PLAYERS_CACHE_TTL = 24 * 60 * 60  # seconds
+# Only these player fields are kept; the rest of the dump is discarded on ingestion
+PLAYER_FIELDS = ('first_name', 'last_name', 'position')
+
+USER_AGENT = 'SleeperLeagueAnalyzer/1.0'
+# Retry transient rate-limit and server errors with exponential backoff
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 0.3  # seconds, doubled after each attempt
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+PROJECTIONS_URL = "https://api.sleeper.com/projections/nfl/{season}/{week}"
+PROJECTIONS_PARAMS = {
+    'season_type': 'regular',
+    'position[]': ['DEF', 'FLEX', 'QB', 'RB', 'SUPER_FLEX', 'TE', 'WR'],
+    'order_by': 'ppr'
+}
+
+# In-process caches so repeated analyses in one session (e.g. a notebook) skip refetching.
+# Live week data goes stale quickly; league settings rarely change.
+# Cached results are returned by reference to every caller, so treat them as read-only.
+SHORT_TTL = 60  # seconds
+LONG_TTL = 60 * 60  # seconds
+_league_info_cache = TTLCache(maxsize=8, ttl=LONG_TTL)
+_matchups_cache = TTLCache(maxsize=8, ttl=SHORT_TTL)
+_projections_cache = TTLCache(maxsize=8, ttl=SHORT_TTL)
+_cache_lock = threading.Lock()
 
 class SleeperLeagueAnalyzer:
     def __init__(self, league_id: str):
         self.league_id = league_id
         self.base_url = "https://api.sleeper.app/v1"
+        self._nfl_state = None
         
+        # Share one pooled session so repeated calls reuse keep-alive connections,
+        # retrying transient rate-limit and server errors with backoff
+        retry = Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF,
+                      status_forcelist=RETRY_STATUSES,
+                      allowed_methods=frozenset(['GET']))
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry))
+        self.session.headers.update({'User-Agent': USER_AGENT})
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+        
+    @cached(_league_info_cache, key=lambda self: self.league_id, lock=_cache_lock)
     def get_league_info(self) -> Dict[str, Any]:
-        """Get basic league information"""
+        """Get basic league information (cached in-process; don't mutate the result)"""
         url = f"{self.base_url}/league/{self.league_id}"
-        print(f"API Request: {url}")
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return self._get_revalidated(url, f"league_{self.league_id}")
     
     def get_users(self) -> List[Dict[str, Any]]:
         """Get all users in the league"""
         url = f"{self.base_url}/league/{self.league_id}/users"
-        print(f"API Request: {url}")
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return self._get_revalidated(url, f"league_{self.league_id}_users")
     
     def get_rosters(self) -> List[Dict[str, Any]]:
         """Get all rosters in the league"""
         url = f"{self.base_url}/league/{self.league_id}/rosters"
         print(f"API Request: {url}")
-        response = requests.get(url)
+        response = self.session.get(url)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     def get_current_week(self) -> int:
         """Get current NFL week"""
-        url = f"{self.base_url}/state/nfl"
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()["week"]
+        return self.get_nfl_state()["week"]
     
+    @cached(_matchups_cache, key=lambda self, week: (self.league_id, week), lock=_cache_lock)
     def get_matchups(self, week: int) -> List[Dict[str, Any]]:
-        """Get matchups for a specific week"""
+        """Get matchups for a specific week (cached in-process; don't mutate the result)"""
         url = f"{self.base_url}/league/{self.league_id}/matchups/{week}"
         print(f"API Request: {url}")
-        response = requests.get(url)
+        response = self.session.get(url)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     def get_players(self) -> Dict[str, Any]:
-        """Get all NFL players data"""
+        """
+        Get NFL players data keyed by player_id, narrowed to PLAYER_FIELDS.
+        Not used by the analysis; kept as a helper for future player enrichment.
+        """
         url = f"{self.base_url}/players/nfl"
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return self._get_revalidated(url, "players_nfl", max_age=PLAYERS_CACHE_TTL,
+                                     transform=self._narrow_players)
     
-    def get_nfl_state(self) -> Dict[str, Any]:
-        """Get current NFL state including week and season info"""
-        url = f"{self.base_url}/state/nfl"
+    def _narrow_players(self, players: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only PLAYER_FIELDS for each player, discarding the rest of the dump"""
+        return {
+            player_id: {field: player.get(field) for field in PLAYER_FIELDS}
+            for player_id, player in players.items()
+        }
+    
+    def _get_revalidated(self, url: str, cache_name: str, max_age: float = 0, transform=None) -> Any:
+        """
+        GET a JSON endpoint through the on-disk cache.
+        A cached copy younger than max_age is returned without any request; otherwise
+        it is revalidated with a conditional GET and reused on 304 Not Modified.
+        transform, if given, is applied to a fresh body before it is cached.
+        Falls back to the cached copy if the request fails.
+        """
+        cache_meta = self._read_cache_meta(cache_name)
+        cache_age = time.time() - cache_meta['generated_at'] if cache_meta else None
+        if cache_age is not None and cache_age < max_age:
+            return self._read_cache(cache_name)
+        
+        headers = {}
+        if cache_meta:
+            if cache_meta.get('etag'):
+                headers['If-None-Match'] = cache_meta['etag']
+            if cache_meta.get('last_modified'):
+                headers['If-Modified-Since'] = cache_meta['last_modified']
+        
         print(f"API Request: {url}")
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        try:
+            # Streamed responses hold their pooled connection until closed, on every path
+            with self.session.get(url, headers=headers, stream=True) as response:
+                if response.status_code == 304 and cache_meta:
+                    self._write_cache_meta(cache_name, cache_meta.get('etag'), cache_meta.get('last_modified'))
+                    return self._read_cache(cache_name)
+                response.raise_for_status()
+                data = self._read_json(response)
+        except requests.exceptions.RequestException:
+            if cache_age is None:
+                raise
+            print(f"✗ Request failed: {url} - using cached copy from {cache_age / 3600:.1f}h ago")
+            return self._read_cache(cache_name)
+        
+        if transform is not None:
+            data = transform(data)
+        self._write_cache(cache_name, data, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return data
     
-    def get_weekly_projections(self, week: int) -> Dict[str, Any]:
+    def _read_json(self, response: requests.Response) -> Any:
         """
-        Get weekly projections using the correct Sleeper API format
+        Parse a streamed response body, accumulating chunks into a single buffer
+        so large payloads aren't held twice in memory while being joined.
+        The caller owns the response and is responsible for closing it.
         """
-        # Use the correct sleeper.com endpoint with parameters
-        url = f"https://api.sleeper.com/projections/nfl/2025/{week}"
-        params = {
-            'season_type': 'regular',
-            'position[]': ['DEF', 'FLEX', 'QB', 'RB', 'SUPER_FLEX', 'TE', 'WR'],
-            'order_by': 'ppr'
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            buf.extend(chunk)
+        return orjson.loads(buf)
+    
+    def _cache_paths(self, cache_name: str):
+        """Return the (body, meta) file paths for a cache entry"""
+        return (os.path.join(CACHE_DIR, f"{cache_name}.{CACHE_FORMAT}"),
+                os.path.join(CACHE_DIR, f"{cache_name}.meta"))
+    
+    def _read_cache_meta(self, cache_name: str):
+        """Return the metadata of a cache entry, or None if there is no usable cache"""
+        body_file, meta_file = self._cache_paths(cache_name)
+        try:
+            with open(meta_file, 'rb') as f:
+                meta = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if 'generated_at' not in meta or meta.get('format') != CACHE_FORMAT:
+            return None
+        if not os.path.exists(body_file):
+            return None
+        return meta
+    
+    def _read_cache(self, cache_name: str) -> Any:
+        """Load a zstd-compressed cache entry"""
+        body_file, _ = self._cache_paths(cache_name)
+        with open(body_file, 'rb') as f:
+            return orjson.loads(zstandard.ZstdDecompressor().decompress(f.read()))
+    
+    def _write_cache(self, cache_name: str, data: Any, etag=None, last_modified=None):
+        """Atomically write a cache entry and its metadata to the cache directory"""
+        body_file, _ = self._cache_paths(cache_name)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_file = f"{body_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(zstandard.ZstdCompressor(level=3).compress(orjson.dumps(data)))
+            os.replace(tmp_file, body_file)
+        except OSError as e:
+            print(f"✗ Could not write {cache_name} cache: {e}")
+            return
+        self._write_cache_meta(cache_name, etag, last_modified)
+    
+    def _write_cache_meta(self, cache_name: str, etag=None, last_modified=None):
+        """Atomically record when a cache entry was (re)validated, along with its HTTP validators"""
+        _, meta_file = self._cache_paths(cache_name)
+        meta = {
+            'generated_at': time.time(),
+            'format': CACHE_FORMAT,
+            'etag': etag,
+            'last_modified': last_modified,
         }
-        
         try:
-            print(f"API Request: {url} with params: {params}")
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                print(f"✓ Found projections: {len(data)} players")
-                
-                # Convert list format to dict format keyed by player_id for easier lookup
-                projections_dict = {}
-                for player_data in data:
-                    player_id = player_data.get('player_id')
-                    if player_id:
-                        projections_dict[player_id] = player_data
-                
-                # Show sample data - find players with actual projections
-                players_with_projections = []
-                for player_data in data[:50]:  # Check first 50 players
-                    stats = player_data.get('stats', {})
-                    if any(key in stats for key in ['pts_ppr', 'fantasy_points_ppr', 'projected_points', 'pts_std']):
-                        players_with_projections.append(player_data)
-                        if len(players_with_projections) >= 3:
-                            break
-                
-                if players_with_projections:
-                    print("Players with projection data:")
-                    for player_data in players_with_projections:
-                        player_name = f"{player_data.get('player', {}).get('first_name', '')} {player_data.get('player', {}).get('last_name', '')}"
-                        stats = player_data.get('stats', {})
-                        print(f"  {player_name}: {stats}")
-                else:
-                    print("No players found with projection stats in first 50 entries")
-                
-                return projections_dict
-            else:
-                print(f"✗ No data at: {url} (Status: {response.status_code})")
+            tmp_meta = f"{meta_file}.tmp"
+            with open(tmp_meta, 'wb') as f:
+                f.write(orjson.dumps(meta))
+            os.replace(tmp_meta, meta_file)
+        except OSError as e:
+            print(f"✗ Could not write {cache_name} cache metadata: {e}")
+    
+    def get_nfl_state(self) -> Dict[str, Any]:
+        """Get current NFL state including week and season info (fetched once per analyzer)"""
+        if self._nfl_state is None:
+            url = f"{self.base_url}/state/nfl"
+            print(f"API Request: {url}")
+            response = self.session.get(url)
+            response.raise_for_status()
+            self._nfl_state = orjson.loads(response.content)
+        return self._nfl_state
+    
+    def set_nfl_state(self, nfl_state: Dict[str, Any]):
+        """Seed the NFL state fetched elsewhere so get_nfl_state() doesn't request it again"""
+        self._nfl_state = nfl_state
+    
+    def get_weekly_projections(self, week: int) -> Dict[str, Any]:
+        """
+        Get weekly projections using the correct Sleeper API format.
+        Successful results are cached in-process and shared, so don't mutate them.
+        Returns an empty dict if they can't be fetched; failures are never cached.
+        """
+        season = self.get_nfl_state()['season']
+        url = self.projections_url(week)
+        try:
+            return self._fetch_weekly_projections(season, week)
+        except requests.exceptions.HTTPError as e:
+            print(f"✗ No data at: {url} (Status: {e.response.status_code})")
         except Exception as e:
             print(f"✗ Error at: {url} - {e}")
         
         return {}
     
+    # Projections are league-independent, so leagues in the same process share entries
+    @cached(_projections_cache, key=lambda self, season, week: (season, week), lock=_cache_lock)
+    def _fetch_weekly_projections(self, season: str, week: int) -> Dict[str, Any]:
+        """Fetch and index weekly projections, raising on any non-200 response"""
+        # Use the correct sleeper.com endpoint with parameters
+        url = PROJECTIONS_URL.format(season=season, week=week)
+        params = PROJECTIONS_PARAMS
+        
+        print(f"API Request: {url} with params: {params}")
+        with self.session.get(url, params=params, stream=True) as response:
+            if response.status_code != 200:
+                raise requests.exceptions.HTTPError(f"Status: {response.status_code}", response=response)
+            return self.index_projections(self._read_json(response))
+    
+    def projections_url(self, week: int) -> str:
+        """Build the sleeper.com projections URL for a week of the current season"""
+        return PROJECTIONS_URL.format(season=self.get_nfl_state()['season'], week=week)
+    
+    def index_projections(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert the projections list into a dict keyed by player_id,
+        printing a few sample entries that carry projection stats
+        """
+        print(f"✓ Found projections: {len(data)} players")
+        
+        # Convert list format to dict format keyed by player_id for easier lookup
+        projections_dict = {}
+        for player_data in data:
+            player_id = player_data.get('player_id')
+            if player_id:
+                projections_dict[player_id] = player_data
+        
+        # Show sample data - find players with actual projections
+        players_with_projections = []
+        for player_data in data[:50]:  # Check first 50 players
+            stats = player_data.get('stats', {})
+            if any(key in stats for key in ['pts_ppr', 'fantasy_points_ppr', 'projected_points', 'pts_std']):
+                players_with_projections.append(player_data)
+                if len(players_with_projections) >= 3:
+                    break
+        
+        if players_with_projections:
+            print("Players with projection data:")
+            for player_data in players_with_projections:
+                player_name = f"{player_data.get('player', {}).get('first_name', '')} {player_data.get('player', {}).get('last_name', '')}"
+                stats = player_data.get('stats', {})
+                print(f"  {player_name}: {stats}")
+        else:
+            print("No players found with projection stats in first 50 entries")
+        
+        return projections_dict
+    
     def get_nfl_schedule(self, week: int) -> Dict[str, Any]:
         """Get NFL schedule for a specific week"""
-        url = f"{self.base_url}/state/nfl"
-        print(f"API Request: {url}")
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return self.get_nfl_state()
     
     def check_player_game_status(self, player_id: str, week: int, players_data: Dict[str, Any]) -> bool:
         """
@@ -147,28 +331,101 @@ class SleeperLeagueAnalyzer:
         # A more sophisticated approach would check actual NFL game times
         return False  # Will be updated with matchup data
 
+def fetch_league_data(analyzer: SleeperLeagueAnalyzer) -> tuple:
+    """
+    Fetch league info, users, rosters, NFL state, matchups and projections
+    using a thread pool over the analyzer's pooled session
+    """
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        # These endpoints are independent, so issue them concurrently
+        # (player data isn't needed for scoring, so /players/nfl is skipped)
+        league_info_future = executor.submit(analyzer.get_league_info)
+        users_future = executor.submit(analyzer.get_users)
+        rosters_future = executor.submit(analyzer.get_rosters)
+        nfl_state_future = executor.submit(analyzer.get_nfl_state)
+        
+        # Week-dependent endpoints can start as soon as the NFL state is known
+        nfl_state = nfl_state_future.result()
+        current_week = nfl_state['week']
+        matchups_future = executor.submit(analyzer.get_matchups, current_week)
+        
+        # Try to find weekly projections
+        print(f"\nSearching for weekly projections for week {current_week}...")
+        projections_future = executor.submit(analyzer.get_weekly_projections, current_week)
+        
+        league_info = league_info_future.result()
+        users = users_future.result()
+        rosters = rosters_future.result()
+        matchups = matchups_future.result()
+        weekly_projections = projections_future.result()
+    
+    return league_info, users, rosters, nfl_state, matchups, weekly_projections
+
+async def fetch_league_data_async(analyzer: SleeperLeagueAnalyzer) -> tuple:
+    """
+    Fetch the same data as fetch_league_data(), sending the api.sleeper.app
+    requests with httpx over HTTP/2 so each wave is multiplexed on one connection.
+    Those requests follow the same retry policy as the session but skip the
+    in-process and on-disk caches; projections still go through get_weekly_projections().
+    """
+    import httpx
+    
+    async def get_json(client, url, **kwargs):
+        print(f"API Request: {url}")
+        # Mirror the session's status retries; connect errors are retried by the transport
+        for attempt in range(RETRY_TOTAL + 1):
+            response = await client.get(url, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                break
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    league_url = f"{analyzer.base_url}/league/{analyzer.league_id}"
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=RETRY_TOTAL)
+    async with httpx.AsyncClient(transport=transport, headers={'User-Agent': USER_AGENT}) as client:
+        # These endpoints are independent, so issue them concurrently
+        league_info, users, rosters, nfl_state = await asyncio.gather(
+            get_json(client, league_url),
+            get_json(client, f"{league_url}/users"),
+            get_json(client, f"{league_url}/rosters"),
+            get_json(client, f"{analyzer.base_url}/state/nfl"),
+        )
+        analyzer.set_nfl_state(nfl_state)
+        current_week = nfl_state['week']
+        
+        # Try to find weekly projections. They come from a different host, so there is
+        # nothing to multiplex; reuse the analyzer's implementation on a worker thread.
+        print(f"\nSearching for weekly projections for week {current_week}...")
+        matchups, weekly_projections = await asyncio.gather(
+            get_json(client, f"{league_url}/matchups/{current_week}"),
+            asyncio.to_thread(analyzer.get_weekly_projections, current_week),
+        )
+    
+    return league_info, users, rosters, nfl_state, matchups, weekly_projections
+
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python sleeper_league_analyzer.py <league_id>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Analyze a Sleeper league's elimination risk")
+    parser.add_argument('league_id', help="Sleeper league ID")
+    parser.add_argument('--xlsx', action=argparse.BooleanOptionalAction, default=False,
+                        help="Also write a color-coded Excel file")
+    parser.add_argument('--http2', action='store_true',
+                        help="Fetch league data with httpx over HTTP/2 instead of the threaded session "
+                             "(same 429/5xx retries, but no caching)")
+    args = parser.parse_args()
     
-    league_id = sys.argv[1]
+    league_id = args.league_id
     analyzer = SleeperLeagueAnalyzer(league_id)
     
     try:
         # Get league data
         print("Fetching league data...")
-        league_info = analyzer.get_league_info()
-        users = analyzer.get_users()
-        rosters = analyzer.get_rosters()
-        nfl_state = analyzer.get_nfl_state()
+        if args.http2:
+            league_data = asyncio.run(fetch_league_data_async(analyzer))
+        else:
+            league_data = fetch_league_data(analyzer)
+        league_info, users, rosters, nfl_state, matchups, weekly_projections = league_data
         current_week = nfl_state['week']
-        matchups = analyzer.get_matchups(current_week)
-        players_data = analyzer.get_players()
-        
-        # Try to find weekly projections
-        print(f"\nSearching for weekly projections for week {current_week}...")
-        weekly_projections = analyzer.get_weekly_projections(current_week)
         
         if weekly_projections:
             print(f"Weekly projections found for {len(weekly_projections)} players")
@@ -208,164 +465,87 @@ def main():
                 else:
                     print(f"  {key}: {value}")
         
-        # Create user lookup
-        user_lookup = {user['user_id']: user for user in users}
-        
         # Process team data
-        teams_data = []
-        for roster in rosters:
-            owner_id = roster.get('owner_id')
-            user = user_lookup.get(owner_id, {})
-            team_name = user.get('display_name', f"Team {roster['roster_id']}")
-            
-            # Find matchup data for this roster
-            matchup_data = next((m for m in matchups if m['roster_id'] == roster['roster_id']), {})
-            
-            # Get current points
-            current_points = matchup_data.get('points', 0)
-            starters_points = matchup_data.get('starters_points', [])
-            total_current = sum(starters_points) if starters_points else current_points
-            
-            # Count starters and check game status
-            starters = roster.get('starters', [])
-            starters_played = 0
-            
-            # Calculate weekly projected points from individual player projections
-            weekly_projected = 0
-            
-            if weekly_projections:
-                for player_id in starters:
-                    if player_id and player_id in weekly_projections:
-                        player_proj_data = weekly_projections[player_id]
-                        stats = player_proj_data.get('stats', {})
-                        
-                        # Look for various projection fields
-                        player_proj = (stats.get('pts_ppr', 0) or 
-                                     stats.get('fantasy_points_ppr', 0) or
-                                     stats.get('projected_points', 0) or
-                                     stats.get('pts_std', 0))
-                        
-                        weekly_projected += player_proj
-            
-            # Use weekly projections if available, otherwise fall back to current points
-            projected_points = weekly_projected if weekly_projected > 0 else total_current
-            
-            # Check each starter to see if their game has started
-            # Use matchup data to see if players have scored points
-            players_points = matchup_data.get('players_points', {})
-            
-            for player_id in starters:
-                if player_id:
-                    # If player has scored any points, assume their game has started
-                    player_points = players_points.get(player_id, 0)
-                    if player_points > 0:
-                        starters_played += 1
-            
-            teams_data.append({
-                'team_name': team_name,
-                'roster_id': roster['roster_id'],
-                'current_points': total_current,
-                'projected_points': projected_points,
-                'starters_total': len([s for s in starters if s]),  # Count non-null starters
-                'starters_played': starters_played
-            })
+        teams_data = process_rosters(rosters, users, matchups, weekly_projections)
         
         # Filter out teams with 0 projections (eliminated teams)
-        active_teams = [team for team in teams_data if team['projected_points'] > 0]
+        active_teams = [team for team in teams_data if team.projected_points > 0]
         
         # Sort by projected points ascending (lowest first - most at risk)
-        active_teams.sort(key=lambda x: x['projected_points'])
+        active_teams.sort(key=operator.attrgetter('projected_points'))
         
-        # Output as both CSV and styled Excel
+        # Output as CSV and JSON, plus styled Excel when requested
         csv_file = f"sleeper_league_{league_id}_week_{current_week}.csv"
         excel_file = f"sleeper_league_{league_id}_week_{current_week}.xlsx"
+        json_file = f"sleeper_league_{league_id}_week_{current_week}.json"
         
         # Create CSV file
         with open(csv_file, 'w', newline='', encoding='utf-8') as csvfile:
             fieldnames = ['Risk Rank', 'Team Name', 'Current Points', 'Projected Points', 'Starters Played', 'Total Starters']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.writer(csvfile)
             
-            writer.writeheader()
-            for i, team in enumerate(active_teams, 1):
-                writer.writerow({
-                    'Risk Rank': i,
-                    'Team Name': team['team_name'],
-                    'Current Points': team['current_points'],
-                    'Projected Points': team['projected_points'],
-                    'Starters Played': team['starters_played'],
-                    'Total Starters': team['starters_total']
-                })
-        
-        # Create styled Excel file
-        wb = Workbook()
-        ws = wb.active
-        ws.title = f"Week {current_week} Risk Analysis"
+            writer.writerow(fieldnames)
+            writer.writerows([
+                [i, team.team_name, team.current_points, team.projected_points,
+                 team.starters_played, team.starters_total]
+                for i, team in enumerate(active_teams, 1)
+            ])
         
-        # Define colors
-        red_fill = PatternFill(start_color="FFCCCB", end_color="FFCCCB", fill_type="solid")  # Light red
-        yellow_fill = PatternFill(start_color="FFFFE0", end_color="FFFFE0", fill_type="solid")  # Light yellow
-        green_fill = PatternFill(start_color="E0FFE0", end_color="E0FFE0", fill_type="solid")  # Light green
-        header_fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")  # Light gray
-        bold_font = Font(bold=True)
+        # Create JSON file for machine consumers (teams already in risk order).
+        # Serialize plain dicts: orjson can't read Team objects from a mypyc-compiled module.
+        with open(json_file, 'wb') as jsonfile:
+            jsonfile.write(orjson.dumps([asdict(team) for team in active_teams], option=orjson.OPT_INDENT_2))
         
-        # Headers
-        headers = ['Risk Rank', 'Team Name', 'Current Points', 'Projected Points', 'Starters Played', 'Total Starters']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = bold_font
-        
-        # Data rows with color coding
-        for i, team in enumerate(active_teams, 1):
-            row = i + 1  # +1 because row 1 is headers
+        # Create styled Excel file (opt-in, since it's the slowest output to produce)
+        if args.xlsx:
+            import xlsxwriter
+            
+            wb = xlsxwriter.Workbook(excel_file)
+            ws = wb.add_worksheet(f"Week {current_week} Risk Analysis")
             
-            # Determine fill color based on risk rank
-            if i <= 2:  # Top 2 most at risk - red
-                fill_color = red_fill
-            elif i <= 5:  # Next 3 - yellow
-                fill_color = yellow_fill
-            else:  # Rest - green
-                fill_color = green_fill
+            # Define colors
+            red_fill = wb.add_format({'bg_color': '#FFCCCB'})  # Light red
+            yellow_fill = wb.add_format({'bg_color': '#FFFFE0'})  # Light yellow
+            green_fill = wb.add_format({'bg_color': '#E0FFE0'})  # Light green
+            header_fill = wb.add_format({'bg_color': '#D3D3D3', 'bold': True})  # Light gray
             
-            # Add data to cells
-            data = [
-                i,  # Risk Rank
-                team['team_name'],
-                team['current_points'],
-                round(team['projected_points'], 2),
-                team['starters_played'],
-                team['starters_total']
+            # Headers and data rows
+            headers = ['Risk Rank', 'Team Name', 'Current Points', 'Projected Points', 'Starters Played', 'Total Starters']
+            rows = [
+                [i, team.team_name, team.current_points, round(team.projected_points, 2),
+                 team.starters_played, team.starters_total]
+                for i, team in enumerate(active_teams, 1)
             ]
             
-            for col, value in enumerate(data, 1):
-                cell = ws.cell(row=row, column=col, value=value)
-                cell.fill = fill_color
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
-        
-        wb.save(excel_file)
+            # Auto-adjust column widths from the in-memory rows
+            for col in range(len(headers)):
+                max_length = max(len(str(row[col])) for row in [headers] + rows)
+                ws.set_column(col, col, min(max_length + 2, 50))
+            
+            ws.write_row(0, 0, headers, header_fill)
+            
+            # Fill color by risk rank: top 2 most at risk red, next 3 yellow, rest green
+            row_fills = [red_fill if i < 2 else yellow_fill if i < 5 else green_fill
+                         for i in range(len(active_teams))]
+            
+            # Data rows with color coding (row 0 is headers)
+            for i, data in enumerate(rows, 1):
+                ws.write_row(i, 0, data, row_fills[i - 1])
+            
+            wb.close()
         
         print(f"\nResults saved to:")
         print(f"  CSV: {csv_file}")
-        print(f"  Excel (styled): {excel_file}")
+        print(f"  JSON: {json_file}")
+        if args.xlsx:
+            print(f"  Excel (styled): {excel_file}")
         
         # Also print to console (only active teams)
         print(f"\nActive Teams Risk Rankings (Lowest Projected Points First):")
         print(f"Active Teams: {len(active_teams)} | Eliminated: {len(teams_data) - len(active_teams)}")
         print("-" * 80)
         for i, team in enumerate(active_teams, 1):
-            print(f"{i:2d}. {team['team_name']:<20} | Current: {team['current_points']:6.1f} | Proj: {team['projected_points']:6.1f} | {team['starters_played']}/{team['starters_total']} played")
+            print(f"{i:2d}. {team.team_name:<20} | Current: {team.current_points:6.1f} | Proj: {team.projected_points:6.1f} | {team.starters_played}/{team.starters_total} played")
             
     except requests.exceptions.RequestException as e:
         print(f"Error fetching data from Sleeper API: {e}")
@@ -373,6 +553,8 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        analyzer.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Team aggregation for the Sleeper League Analyzer
+Pure-Python scoring over already-fetched league data, kept free of network
+and output code so it can be compiled (e.g. with mypyc or Cython) for
+batch runs over many leagues.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any
+
+@dataclass(slots=True)
+class Team:
+    """A team's scoring summary for the current week"""
+    team_name: str
+    roster_id: int
+    current_points: float
+    projected_points: float
+    starters_total: int
+    starters_played: int
+
+def process_rosters(rosters: List[Dict[str, Any]], users: List[Dict[str, Any]],
+                    matchups: List[Dict[str, Any]], weekly_projections: Dict[str, Any]) -> List[Team]:
+    """Build a Team summary for each roster from its owner, matchup and starter projections"""
+    # Create user lookup
+    user_lookup = {user['user_id']: user for user in users}
+    
+    # Create matchup lookup
+    matchup_by_roster = {m['roster_id']: m for m in matchups}
+    
+    # Resolve each player's projected points once, checking the various projection fields
+    proj_by_pid: Dict[str, float] = {}
+    for player_id, player_proj_data in weekly_projections.items():
+        stats = player_proj_data.get('stats', {})
+        proj_by_pid[player_id] = (stats.get('pts_ppr') or
+                                  stats.get('fantasy_points_ppr') or
+                                  stats.get('projected_points') or
+                                  stats.get('pts_std') or 0)
+    
+    # Process team data
+    teams_data: List[Team] = []
+    for roster in rosters:
+        owner_id = roster.get('owner_id')
+        user = user_lookup.get(owner_id, {})
+        team_name = user.get('display_name', f"Team {roster['roster_id']}")
+        
+        # Find matchup data for this roster
+        matchup_data = matchup_by_roster.get(roster['roster_id'], {})
+        
+        # Get current points
+        current_points = matchup_data.get('points', 0)
+        starters_points = matchup_data.get('starters_points', [])
+        total_current = sum(starters_points) if starters_points else current_points
+        
+        # Count starters and check game status
+        starters: List[Optional[str]] = roster.get('starters', [])
+        starters_played = 0
+        
+        # Calculate weekly projected points from individual player projections
+        weekly_projected = sum(proj_by_pid.get(starter_id, 0) for starter_id in starters if starter_id)
+        
+        # Use weekly projections if available, otherwise fall back to current points
+        projected_points = weekly_projected if weekly_projected > 0 else total_current
+        
+        # Check each starter to see if their game has started
+        # Use matchup data to see if players have scored points
+        players_points = matchup_data.get('players_points', {})
+        
+        for starter_id in starters:
+            if starter_id:
+                # If player has scored any points, assume their game has started
+                player_points = players_points.get(starter_id, 0)
+                if player_points > 0:
+                    starters_played += 1
+        
+        teams_data.append(Team(
+            team_name=team_name,
+            roster_id=roster['roster_id'],
+            current_points=total_current,
+            projected_points=projected_points,
+            starters_total=len([s for s in starters if s]),  # Count non-null starters
+            starters_played=starters_played
+        ))
+    
+    return teams_data
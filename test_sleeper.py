@@ -9,15 +9,19 @@ def test_sleeper_api():
     """Test basic Sleeper API connectivity"""
     print("Testing Sleeper API connectivity...")
     
+    session = requests.Session()
+    
     # Test NFL state endpoint
     try:
-        response = requests.get("https://api.sleeper.app/v1/state/nfl")
+        response = session.get("https://api.sleeper.app/v1/state/nfl")
         response.raise_for_status()
         nfl_state = response.json()
         print(f"✓ NFL State: Week {nfl_state['week']}, Season {nfl_state['season']}")
     except Exception as e:
         print(f"✗ NFL State test failed: {e}")
         return False
+    finally:
+        session.close()
     
     # Test with a known public league (if available)
     print("\nAPI connectivity test passed!")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk response cache and its conditional GET revalidation
+"""
+
+import time
+
+import orjson
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import sleeper_league_analyzer
+from sleeper_league_analyzer import SleeperLeagueAnalyzer
+
+URL = "https://api.sleeper.app/v1/league/123"
+
+class FakeSession:
+    """Stands in for requests.Session, replaying canned responses and recording request headers"""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, stream=False):
+        self.requests.append(dict(headers or {}))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        response.url = url
+        return response
+
+def make_response(status_code, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = ""
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = orjson.dumps(body) if body is not None else b""
+    response._content_consumed = True
+    return response
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    monkeypatch.setattr(sleeper_league_analyzer, "CACHE_DIR", str(tmp_path))
+    return SleeperLeagueAnalyzer("123")
+
+def test_fresh_cache_skips_request(analyzer):
+    analyzer._write_cache("league", {"name": "cached"})
+    analyzer.session = FakeSession()
+
+    assert analyzer._get_revalidated(URL, "league", max_age=60) == {"name": "cached"}
+    assert analyzer.session.requests == []
+
+def test_stale_cache_reused_on_304(analyzer):
+    analyzer._write_cache("league", {"name": "cached"}, etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+    analyzer.session = FakeSession(make_response(304))
+
+    assert analyzer._get_revalidated(URL, "league") == {"name": "cached"}
+    assert analyzer.session.requests == [{
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': "Mon, 01 Jan 2024 00:00:00 GMT",
+    }]
+    assert analyzer._read_cache_meta("league")['etag'] == '"v1"'
+
+def test_modified_response_replaces_cache_and_validators(analyzer):
+    analyzer._write_cache("league", {"name": "old"}, etag='"v1"')
+    analyzer.session = FakeSession(make_response(200, {"name": "new"}, {'ETag': '"v2"', 'Last-Modified': "Tue"}))
+
+    assert analyzer._get_revalidated(URL, "league") == {"name": "new"}
+    assert analyzer._read_cache("league") == {"name": "new"}
+    meta = analyzer._read_cache_meta("league")
+    assert (meta['etag'], meta['last_modified']) == ('"v2"', "Tue")
+
+def test_transform_applied_before_caching(analyzer):
+    analyzer.session = FakeSession(make_response(200, {"1": {"first_name": "A", "college": "X"}}))
+
+    players = analyzer._get_revalidated(URL, "players", transform=analyzer._narrow_players)
+    assert players == {"1": {"first_name": "A", "last_name": None, "position": None}}
+    assert analyzer._read_cache("players") == players
+
+def test_failed_request_falls_back_to_stale_cache(analyzer):
+    analyzer._write_cache("league", {"name": "cached"})
+    analyzer.session = FakeSession(make_response(404))
+
+    assert analyzer._get_revalidated(URL, "league") == {"name": "cached"}
+
+def test_failed_request_without_cache_raises(analyzer):
+    analyzer.session = FakeSession(requests.exceptions.ConnectionError("down"))
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        analyzer._get_revalidated(URL, "league")
+
+def test_format_mismatch_ignores_cache(analyzer):
+    analyzer._write_cache("league", {"name": "cached"}, etag='"v1"')
+    _, meta_file = analyzer._cache_paths("league")
+    with open(meta_file, 'wb') as f:
+        f.write(orjson.dumps({'generated_at': time.time(), 'format': "json", 'etag': '"v1"'}))
+    analyzer.session = FakeSession(make_response(200, {"name": "new"}))
+
+    assert analyzer._read_cache_meta("league") is None
+    assert analyzer._get_revalidated(URL, "league", max_age=60) == {"name": "new"}
+    assert analyzer.session.requests == [{}]
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for team aggregation; these run against team_aggregation whether it is
+plain Python or compiled in place with mypyc
+"""
+
+from dataclasses import asdict
+
+import orjson
+
+from team_aggregation import Team, process_rosters
+
+ROSTERS = [
+    {'roster_id': 1, 'owner_id': 'u1', 'starters': ['p1', 'p2', None]},
+    {'roster_id': 2, 'owner_id': 'u2', 'starters': ['p3', 'p4']},
+    {'roster_id': 3, 'owner_id': 'gone', 'starters': ['p5']},
+]
+USERS = [
+    {'user_id': 'u1', 'display_name': 'Alpha'},
+    {'user_id': 'u2', 'display_name': 'Bravo'},
+]
+MATCHUPS = [
+    {'roster_id': 1, 'points': 99, 'starters_points': [4.5, 1.5], 'players_points': {'p1': 4.5, 'p2': 0}},
+    {'roster_id': 2, 'points': 7.0, 'players_points': {'p3': 3.0, 'p4': 4.0}},
+]
+PROJECTIONS = {
+    'p1': {'stats': {'pts_ppr': 12.0}},
+    'p2': {'stats': {'pts_ppr': 0, 'fantasy_points_ppr': 0, 'pts_std': 5.5}},
+    'p3': {'stats': {}},
+}
+
+def test_process_rosters():
+    teams = process_rosters(ROSTERS, USERS, MATCHUPS, PROJECTIONS)
+
+    assert teams == [
+        # Projections fall through to the first non-zero field; starter points win over matchup points
+        Team(team_name='Alpha', roster_id=1, current_points=6.0, projected_points=17.5,
+             starters_total=2, starters_played=1),
+        # No projections for any starter, so current points stand in for the projection
+        Team(team_name='Bravo', roster_id=2, current_points=7.0, projected_points=7.0,
+             starters_total=2, starters_played=2),
+        # Unknown owner and no matchup: default name and zero points (an eliminated team)
+        Team(team_name='Team 3', roster_id=3, current_points=0, projected_points=0,
+             starters_total=1, starters_played=0),
+    ]
+
+def test_process_rosters_without_projections():
+    teams = process_rosters(ROSTERS[:1], USERS, MATCHUPS, {})
+
+    assert teams[0].projected_points == 6.0
+
+def test_teams_serialize_as_dicts():
+    teams = process_rosters(ROSTERS, USERS, MATCHUPS, PROJECTIONS)
+
+    rows = orjson.loads(orjson.dumps([asdict(team) for team in teams]))
+    assert rows[0] == {
+        'team_name': 'Alpha', 'roster_id': 1, 'current_points': 6.0, 'projected_points': 17.5,
+        'starters_total': 2, 'starters_played': 1,
+    }